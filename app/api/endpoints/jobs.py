@@ -100,8 +100,10 @@ def get_jobs(
     # Get total before pagination
     total = query.count()
     
-    # Order by date posted (newest first) and apply pagination
-    query = query.order_by(Job.date_posted.desc()).offset(offset).limit(limit)
+    # Order by first_seen (newest first), the key the dashboard table sorts
+    # on, so it can skip re-sorting; date_posted breaks ties so pages are
+    # stable. Then apply pagination.
+    query = query.order_by(Job.first_seen.desc(), Job.date_posted.desc()).offset(offset).limit(limit)
     
     jobs = query.all()
     
@@ -76,11 +76,8 @@ def admin_users_page():
     st.subheader(f"All Users ({len(df)})")
     
     # Load compact CSS styling
-    import os
-    css_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                          "static", "css", "compact.css")
-    with open(css_path, "r") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    from dashboard_components.utils import read_static_file
+    st.markdown(f"<style>{read_static_file('css', 'compact.css')}</style>", unsafe_allow_html=True)
     
     # Display users in a table
     cols = st.columns([3, 2, 2, 2, 2])
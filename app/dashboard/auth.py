@@ -175,33 +175,10 @@ def clear_auth_cookie():
 
 def check_for_auth_cookie():
     """Check for a valid authentication cookie and restore session if found"""
-    # Add JavaScript to check for cookie and report back
-    js_code = f"""
-    <script>
-    // Function to get cookie value by name
-    function getCookie(name) {{
-        const value = `; ${{document.cookie}}`;
-        const parts = value.split(`; ${{name}}=`);
-        if (parts.length === 2) return parts.pop().split(';').shift();
-        return null;
-    }}
-    
-    // Check for auth cookie
-    const sessionId = getCookie('{get_session_cookie_key()}');
-    
-    // If we have a session ID, store it in localStorage for simple retrieval
-    if (sessionId) {{
-        localStorage.setItem('current_session_id', sessionId);
-        console.log('Found existing session:', sessionId);
-    }}
-    
-    // Set a flag to indicate we've checked for cookies
-    localStorage.setItem('cookie_check_complete', 'true');
-    </script>
-    """
-    
-    # Inject the JavaScript to check for cookies
-    st.markdown(js_code, unsafe_allow_html=True)
+    # No cookie-probing <script> is emitted here: st.markdown never runs
+    # scripts, and this function is called on every anonymous rerun, so it
+    # only cost a markdown parse of the blob each time. Sessions are restored
+    # from the server-side session store below.
     
     # If we're already authenticated in session state, we're done
     if is_authenticated():
@@ -391,6 +368,9 @@ def logout():
             "token": None
         }
         
+        # Drop the signed-out user's cached tracked jobs
+        st.session_state.pop("_tracked_jobs_cache", None)
+        
         # Clear auth cookie
         clear_auth_cookie()
         
@@ -9,7 +9,9 @@ import os
 import logging
 
 # Add parent directory to path to import log_manager
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 from log_manager import get_log_files, read_log_content, cleanup_old_logs
 from system_info import get_system_info, get_api_stats, format_system_info
 
@@ -3,19 +3,61 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import logging
+import time
 
 from app.dashboard.auth import api_request, auth_required, get_current_user
 
 # Configure logging
 logger = logging.getLogger("job_tracker.dashboard.user_jobs")
 
+# How long a fetched user/jobs list is reused across reruns
+TRACKED_JOBS_TTL = 30
+
+def fetch_tracked_jobs():
+    """Fetch the user's tracked jobs, reusing the last result for TRACKED_JOBS_TTL seconds
+
+    Kept in session state so the auth token never has to become part of a
+    shared cache key. Session state belongs to the browser session rather
+    than the user, so the entry records whose jobs it holds and is ignored
+    after a different user logs in on the same tab.
+    """
+    user = get_current_user() or {}
+    user_email = user.get("email")
+    cached = st.session_state.get("_tracked_jobs_cache")
+    if cached and cached[0] == user_email and time.time() - cached[1] < TRACKED_JOBS_TTL:
+        return cached[2]
+    tracked_jobs = api_request("user/jobs")
+    if tracked_jobs is not None:
+        # Index the tracking info by job id once, for get_job_tracking
+        tracking_by_id = {job["id"]: job.get("tracking") for job in tracked_jobs}
+        st.session_state._tracked_jobs_cache = (user_email, time.time(), tracked_jobs, tracking_by_id)
+    return tracked_jobs
+
+def get_job_tracking(job_id):
+    """Return the tracking info for one job, or None if the user doesn't track it"""
+    if fetch_tracked_jobs() is None:
+        return None
+    return st.session_state._tracked_jobs_cache[3].get(job_id)
+
+def update_tracking(endpoint, method, data=None):
+    """Send a tracking change to the API and drop the cached tracked jobs on success"""
+    result = api_request(endpoint, method=method, data=data)
+    if result:
+        st.session_state.pop("_tracked_jobs_cache", None)
+        # The jobs table caches applied ids too; keep it in step
+        from dashboard_components.custom_jobs_table import forget_applied_jobs
+        user = get_current_user()
+        if user and "email" in user:
+            forget_applied_jobs(user["email"])
+    return result
+
 @auth_required
 def tracked_jobs_page():
     """Display and manage the user's tracked jobs"""
     st.title("My Tracked Jobs")
     
     # Fetch tracked jobs
-    tracked_jobs = api_request("user/jobs")
+    tracked_jobs = fetch_tracked_jobs()
     if not tracked_jobs:
         st.info("You haven't tracked any jobs yet. Browse the job listings and save jobs to track them here.")
         return
@@ -32,18 +74,15 @@ def tracked_jobs_page():
     
     # Filter if needed
     if applied_filter:
-        df = df[df["tracking"].apply(lambda x: x.get("is_applied", False) == True)]
+        df = df[df["tracking"].str.get("is_applied").fillna(False).astype(bool)]
     
     if len(df) == 0:
         st.info("No jobs match your current filters.")
         return
     
     # Load compact CSS styling
-    import os
-    css_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                          "static", "css", "compact.css")
-    with open(css_path, "r") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    from dashboard_components.utils import read_static_file
+    st.markdown(f"<style>{read_static_file('css', 'compact.css')}</style>", unsafe_allow_html=True)
         
     # Display jobs
     st.subheader(f"Your Tracked Jobs ({len(df)})")
@@ -78,7 +117,7 @@ def tracked_jobs_page():
                 # Action buttons
                 if row["tracking"].get("is_applied", False):
                     if st.button("Mark as Not Applied", key=f"unapply_{row['id']}"):
-                        if api_request(
+                        if update_tracking(
                             f"user/jobs/{row['id']}/applied",
                             method="PUT",
                             data={"applied": False}
@@ -89,7 +128,7 @@ def tracked_jobs_page():
                             st.error("Failed to update status")
                 else:
                     if st.button("Mark as Applied", key=f"apply_{row['id']}"):
-                        if api_request(
+                        if update_tracking(
                             f"user/jobs/{row['id']}/applied",
                             method="PUT",
                             data={"applied": True}
@@ -100,7 +139,7 @@ def tracked_jobs_page():
                             st.error("Failed to update status")
                 
                 if st.button("Remove", key=f"remove_{row['id']}"):
-                    if api_request(
+                    if update_tracking(
                         f"user/jobs/{row['id']}/track",
                         method="DELETE"
                     ):
@@ -133,13 +172,8 @@ def add_job_tracking_buttons(job_id, job_data=None):
     if job_data:
         tracked_data = job_data
     else:
-        # Fetch data for this specific job
-        user_jobs = api_request("user/jobs")
-        if user_jobs:
-            # Find this job in the tracked jobs
-            tracked_job = next((j for j in user_jobs if j["id"] == job_id), None)
-            if tracked_job:
-                tracked_data = tracked_job.get("tracking")
+        # Look this job up in the tracked jobs indexed by id
+        tracked_data = get_job_tracking(job_id)
     
     col1, col2 = st.columns(2)
     
@@ -151,7 +185,7 @@ def add_job_tracking_buttons(job_id, job_data=None):
             
             if is_applied:
                 if st.button("Mark as Not Applied", key=f"unapply_btn_{job_id}"):
-                    if api_request(
+                    if update_tracking(
                         f"user/jobs/{job_id}/applied",
                         method="PUT",
                         data={"applied": False}
@@ -162,7 +196,7 @@ def add_job_tracking_buttons(job_id, job_data=None):
                         st.error("Failed to update status")
             else:
                 if st.button("Mark as Applied", key=f"apply_btn_{job_id}"):
-                    if api_request(
+                    if update_tracking(
                         f"user/jobs/{job_id}/applied",
                         method="PUT",
                         data={"applied": True}
@@ -175,7 +209,7 @@ def add_job_tracking_buttons(job_id, job_data=None):
         with col2:
             # Remove from tracking
             if st.button("Remove from Saved", key=f"remove_btn_{job_id}"):
-                if api_request(
+                if update_tracking(
                     f"user/jobs/{job_id}/track",
                     method="DELETE"
                 ):
@@ -188,7 +222,7 @@ def add_job_tracking_buttons(job_id, job_data=None):
     else:
         with col1:
             if st.button("Save Job", key=f"save_btn_{job_id}"):
-                if api_request(
+                if update_tracking(
                     f"user/jobs/{job_id}/track",
                     method="POST"
                 ):
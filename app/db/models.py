@@ -76,6 +76,13 @@ class ScraperRun(Base):
     jobs_updated = Column(Integer, default=0)
     error_message = Column(Text)
 
+class CleanupRun(Base):
+    """When cleanup.py last finished; a single row with id 1, upserted per run"""
+    __tablename__ = 'cleanup_runs'
+    
+    id = Column(Integer, primary_key=True)
+    last_run = Column(DateTime(timezone=True), nullable=False)
+
 class User(Base):
     """User account information for authentication and authorization"""
     __tablename__ = 'users'
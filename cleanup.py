@@ -3,31 +3,103 @@ Script to clean up the project and fix data issues
 """
 import os
 import sys
+import time
+import argparse
 import psycopg2
+from psycopg2 import errors
 from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import ISOLATION_LEVEL_SERIALIZABLE
 import shutil
-from app.config import SQLALCHEMY_DATABASE_URL
+
+# app.config only loads .env and resolves settings, so importing it is cheap;
+# it keeps the connection string (and its default) defined in one place
+from app.config import SQLALCHEMY_DATABASE_URL as DATABASE_URL
+
+# Subtrees pruned from the __pycache__ sweep
+from utils.cleanup_utils import SKIP_DIRS
+
+# Tries of the serializable cleanup transaction before giving up
+CLEANUP_ATTEMPTS = 3
 
 def get_connection():
     """Get a connection to the database"""
     try:
-        conn = psycopg2.connect(SQLALCHEMY_DATABASE_URL)
+        conn = psycopg2.connect(DATABASE_URL)
         return conn
     except Exception as e:
         print(f"Error connecting to database: {str(e)}")
         sys.exit(1)
 
-def cleanup_database():
-    """Clean up the database by removing duplicate records and fixing issues"""
+def cleanup_database(force=False):
+    """Clean up the database by removing duplicate records and fixing issues
+
+    The run is skipped if the previous cleanup finished less than an hour ago,
+    no job has been inserted or updated since and every job still has a role;
+    pass force=True (--force on the command line) to always run.
+    """
     conn = get_connection()
-    cursor = conn.cursor()
+    # All phases run in one serializable transaction, configured before any
+    # statement is issued so no earlier session state leaks in
+    conn.set_session(isolation_level=ISOLATION_LEVEL_SERIALIZABLE, autocommit=False)
     
     print("\n===== CLEANING UP DATABASE =====")
     
     try:
-        # Start transaction
-        conn.autocommit = False
-        
+        # The duplicate DELETE and NULL-fix UPDATE touch the whole jobs table,
+        # so a concurrent scraper write can abort the transaction with a
+        # serialization failure; that is safe to simply run again
+        for attempt in range(1, CLEANUP_ATTEMPTS + 1):
+            try:
+                _cleanup_database_once(conn, force)
+                break
+            except errors.SerializationFailure:
+                conn.rollback()
+                if attempt == CLEANUP_ATTEMPTS:
+                    raise
+                print(f"Cleanup conflicted with a concurrent write, retrying ({attempt}/{CLEANUP_ATTEMPTS - 1})")
+                time.sleep(attempt)
+    except Exception as e:
+        # Rollback in case of error
+        conn.rollback()
+        print(f"Error cleaning up database: {str(e)}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+def _cleanup_database_once(conn, force):
+    """Run one attempt of the cleanup transaction on conn"""
+    with conn.cursor() as cursor:
+        # Serialize concurrent cleanups (cron + manual runs). The lock is
+        # transaction-scoped, so commit/rollback always releases it.
+        cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext('job_tracker_cleanup'))")
+        if not cursor.fetchone()[0]:
+            print("Another database cleanup is already running, skipping")
+            conn.rollback()
+            return
+    
+        # Skip when the last run is recent and nothing has been written since.
+        # jobs timestamps are naive UTC, hence the AT TIME ZONE conversion.
+        # job_roles has no timestamps, so look for role-less jobs directly.
+        cursor.execute("""
+            SELECT r.last_run > now() - interval '1 hour'
+                AND NOT EXISTS (
+                    SELECT 1 FROM jobs
+                    WHERE first_seen > (r.last_run AT TIME ZONE 'UTC')
+                       OR last_updated > (r.last_run AT TIME ZONE 'UTC')
+                )
+                AND NOT EXISTS (
+                    SELECT 1 FROM jobs j
+                    WHERE NOT EXISTS (SELECT 1 FROM job_roles jr WHERE jr.job_id = j.id)
+                )
+            FROM cleanup_runs r
+            WHERE r.id = 1
+        """)
+        result = cursor.fetchone()
+        if not force and result and result[0]:
+            print("Database cleaned up within the last hour and no jobs changed since, skipping")
+            conn.commit()
+            return
+    
         # 1. Find and remove duplicate jobs
         print("Checking for duplicate jobs...")
         cursor.execute("""
@@ -44,21 +116,13 @@ def cleanup_database():
                 JOIN duplicate_jobs d ON j.job_id = d.job_id AND j.company = d.company
                 WHERE j.id <> d.keep_id
             )
-            RETURNING id
         """)
-        deleted_count = len(cursor.fetchall() or [])
+        deleted_count = cursor.rowcount
         print(f"Removed {deleted_count} duplicate job entries")
-        
+    
         # 2. Make sure all jobs have at least one role
         print("Checking for jobs without roles...")
-        cursor.execute("""
-            SELECT j.id, j.job_title, j.company
-            FROM jobs j
-            LEFT JOIN job_roles jr ON j.id = jr.job_id
-            WHERE jr.job_id IS NULL
-        """)
-        jobs_without_roles = cursor.fetchall() or []
-        
+    
         # Get default role ID or create one
         cursor.execute("SELECT id FROM roles WHERE name = 'General' LIMIT 1")
         result = cursor.fetchone()
@@ -67,16 +131,18 @@ def cleanup_database():
         else:
             cursor.execute("INSERT INTO roles (name) VALUES ('General') RETURNING id")
             default_role_id = cursor.fetchone()[0]
-        
-        # Add default role to jobs without roles
-        for job in jobs_without_roles:
-            cursor.execute(
-                "INSERT INTO job_roles (job_id, role_id) VALUES (%s, %s)",
-                (job[0], default_role_id)
-            )
-        
-        print(f"Added default role to {len(jobs_without_roles)} jobs without roles")
-        
+    
+        # Add default role to jobs without roles in a single statement
+        cursor.execute("""
+            INSERT INTO job_roles (job_id, role_id)
+            SELECT j.id, %s
+            FROM jobs j
+            LEFT JOIN job_roles jr ON j.id = jr.job_id
+            WHERE jr.job_id IS NULL
+        """, (default_role_id,))
+    
+        print(f"Added default role to {cursor.rowcount} jobs without roles")
+    
         # 3. Fix any NULL values in important fields
         print("Fixing NULL values in critical fields...")
         cursor.execute("""
@@ -91,23 +157,19 @@ def cleanup_database():
                 location IS NULL OR location = '' OR
                 date_posted IS NULL OR
                 is_active IS NULL
-            RETURNING id
         """)
-        fixed_count = len(cursor.fetchall() or [])
+        fixed_count = cursor.rowcount
         print(f"Fixed {fixed_count} records with NULL values")
-        
+    
+        # Record this run for the short-circuit check above (a single row)
+        cursor.execute("""
+            INSERT INTO cleanup_runs (id, last_run) VALUES (1, now())
+            ON CONFLICT (id) DO UPDATE SET last_run = EXCLUDED.last_run
+        """)
+    
         # Commit all changes
         conn.commit()
         print("Database cleanup completed successfully")
-        
-    except Exception as e:
-        # Rollback in case of error
-        conn.rollback()
-        print(f"Error cleaning up database: {str(e)}")
-        sys.exit(1)
-    finally:
-        cursor.close()
-        conn.close()
 
 def cleanup_project_files():
     """Clean up unnecessary project files"""
@@ -126,24 +188,23 @@ def cleanup_project_files():
     
     # Remove unnecessary files
     for file in files_to_remove:
-        if os.path.exists(file):
-            try:
-                os.remove(file)
-                print(f"Removed: {file}")
-            except Exception as e:
-                print(f"Error removing {file}: {str(e)}")
-    
-    # Rename files
+        try:
+            os.remove(file)
+            print(f"Removed: {file}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {file}: {str(e)}")
+
+    # Rename files (os.replace overwrites an existing destination atomically)
     for old_name, new_name in files_to_rename.items():
-        if os.path.exists(old_name):
-            try:
-                # If destination exists, remove it first
-                if os.path.exists(new_name):
-                    os.remove(new_name)
-                os.rename(old_name, new_name)
-                print(f"Renamed: {old_name} -> {new_name}")
-            except Exception as e:
-                print(f"Error renaming {old_name}: {str(e)}")
+        try:
+            os.replace(old_name, new_name)
+            print(f"Renamed: {old_name} -> {new_name}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error renaming {old_name}: {str(e)}")
     
     # Cleanup pycache directories
     for root, dirs, files in os.walk('.'):
@@ -154,14 +215,21 @@ def cleanup_project_files():
                 print(f"Removed: {pycache_path}")
             except Exception as e:
                 print(f"Error removing {pycache_path}: {str(e)}")
+        # Don't descend into removed caches, VCS data or virtualenvs
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
     
     print("Project file cleanup completed")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean up the project and fix data issues")
+    parser.add_argument("--force", action="store_true",
+                        help="run the database cleanup even if it ran within the last hour")
+    args = parser.parse_args()
+    
     print("======= PROJECT CLEANUP =======")
     
     try:
-        cleanup_database()
+        cleanup_database(force=args.force)
         cleanup_project_files()
         
         print("\n======= CLEANUP COMPLETE =======")
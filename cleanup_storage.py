@@ -4,7 +4,10 @@ import os
 import shutil
 import logging
 import time
-from datetime import datetime, timedelta
+import sqlite3
+from datetime import datetime
+
+from utils.cleanup_utils import SKIP_DIRS
 
 # Setup logging
 logging.basicConfig(
@@ -18,77 +21,145 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Sidecar cache used by get_directory_size(use_cache=True)
+SIZE_CACHE_PATH = ".cleanup_cache.sqlite"
+
+# Files cleanup_logs truncates when they grow too large
+LOG_EXTENSIONS = (".log",)
+
+# Files that are appended to or rewritten in place, which leaves their
+# directory's mtime untouched; get_directory_size never caches their sizes
+GROWS_IN_PLACE_EXTENSIONS = LOG_EXTENSIONS + (".db", ".sqlite", ".sqlite3", ".csv")
+
 def get_file_size(file_path):
     """Get file size in MB"""
     return os.path.getsize(file_path) / (1024 * 1024)
 
 def cleanup_backups(backups_dir="backups", max_age_days=7):
-    """Clean up backup files older than specified days"""
+    """Clean up backup files older than specified days, returning the MB freed"""
     if not os.path.exists(backups_dir):
         logger.warning(f"Backup directory {backups_dir} not found.")
-        return
+        return 0
 
     logger.info(f"Cleaning up backup files in {backups_dir}...")
     backup_count = 0
     backup_size = 0
     
-    # Calculate cutoff date
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
+    # Calculate cutoff as epoch seconds so each file costs a float comparison
+    cutoff_ts = time.time() - max_age_days * 86400
     
-    for filename in os.listdir(backups_dir):
-        file_path = os.path.join(backups_dir, filename)
-        
-        # Skip directories
-        if os.path.isdir(file_path):
-            continue
-            
-        # Check file age
-        file_modified = datetime.fromtimestamp(os.path.getmtime(file_path))
-        
-        if file_modified < cutoff_date:
-            file_size = get_file_size(file_path)
-            logger.info(f"Removing old backup: {filename} ({file_size:.2f} MB)")
+    with os.scandir(backups_dir) as entries:
+        for entry in entries:
+            # Skip directories
+            if entry.is_dir():
+                continue
+                
+            # Check file age
+            file_stat = entry.stat()
             
-            try:
-                os.remove(file_path)
-                backup_count += 1
-                backup_size += file_size
-            except Exception as e:
-                logger.error(f"Error removing {filename}: {str(e)}")
+            if file_stat.st_mtime < cutoff_ts:
+                file_size = file_stat.st_size / (1024 * 1024)
+                logger.info(f"Removing old backup: {entry.name} ({file_size:.2f} MB)")
+                
+                try:
+                    os.remove(entry.path)
+                    backup_count += 1
+                    backup_size += file_size
+                except Exception as e:
+                    logger.error(f"Error removing {entry.name}: {str(e)}")
     
     logger.info(f"Removed {backup_count} old backup files, freeing {backup_size:.2f} MB")
+    return backup_size
 
 def cleanup_git():
-    """Run git garbage collection to optimize storage"""
+    """Run git garbage collection to optimize storage, returning the MB freed"""
     try:
         logger.info("Running Git garbage collection...")
         start_time = time.time()
         
+        # Get .git directory size before and after
+        git_dir_size_before = get_directory_size(".git")
+        
         # Run git gc
         os.system("git gc --aggressive --prune=now")
         
-        # Get .git directory size before and after
         git_dir_size_after = get_directory_size(".git")
         
         logger.info(f"Git optimization completed in {time.time() - start_time:.2f} seconds")
         logger.info(f"Git directory size after optimization: {git_dir_size_after:.2f} MB")
+        return git_dir_size_before - git_dir_size_after
     except Exception as e:
         logger.error(f"Error during Git optimization: {str(e)}")
+        return 0
+
+def _open_size_cache():
+    """Open the sidecar cache of per-directory totals of static files"""
+    conn = sqlite3.connect(SIZE_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS dir_static_sizes "
+        "(path TEXT PRIMARY KEY, dir_mtime REAL, size INTEGER)"
+    )
+    return conn
 
-def get_directory_size(directory):
-    """Get directory size in MB"""
+def get_directory_size(directory, use_cache=False):
+    """Get directory size in MB
+    
+    With use_cache, the total of the files directly inside each directory is
+    kept in a sqlite sidecar keyed by the directory's mtime, which changes
+    whenever an entry is added, removed or renamed. Unchanged directories then
+    cost one stat instead of one per file. A file growing in place does not
+    touch its directory's mtime, so logs, database files and CSV exports
+    (GROWS_IN_PLACE_EXTENSIONS) are left out of the cached total and stat'ed
+    on every call. Any other file rewritten in place keeps its old size in the
+    cache until an entry of its directory changes; call without use_cache when
+    an exact figure matters.
+    """
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            total_size += os.path.getsize(file_path)
+    if not use_cache:
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                total_size += os.path.getsize(file_path)
+        return total_size / (1024 * 1024)  # Convert to MB
+    
+    conn = _open_size_cache()
+    try:
+        with conn:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                key = os.path.abspath(dirpath)
+                dir_mtime = os.stat(dirpath).st_mtime
+                
+                total_size += sum(
+                    os.path.getsize(os.path.join(dirpath, f))
+                    for f in filenames if f.endswith(GROWS_IN_PLACE_EXTENSIONS)
+                )
+                
+                cached = conn.execute(
+                    "SELECT dir_mtime, size FROM dir_static_sizes WHERE path = ?", (key,)
+                ).fetchone()
+                if cached and cached[0] == dir_mtime:
+                    total_size += cached[1]
+                    continue
+                
+                dir_size = sum(
+                    os.path.getsize(os.path.join(dirpath, f))
+                    for f in filenames if not f.endswith(GROWS_IN_PLACE_EXTENSIONS)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO dir_static_sizes (path, dir_mtime, size) VALUES (?, ?, ?)",
+                    (key, dir_mtime, dir_size)
+                )
+                total_size += dir_size
+    finally:
+        conn.close()
     
     return total_size / (1024 * 1024)  # Convert to MB
 
 def cleanup_pycache():
-    """Clean up __pycache__ directories"""
+    """Clean up __pycache__ directories, returning the MB freed"""
     pycache_dirs = []
-    pycache_size = 0
     
     logger.info("Finding __pycache__ directories...")
     
@@ -96,31 +167,37 @@ def cleanup_pycache():
     for root, dirs, files in os.walk("."):
         if "__pycache__" in dirs:
             pycache_path = os.path.join(root, "__pycache__")
-            pycache_dirs.append(pycache_path)
-            pycache_size += get_directory_size(pycache_path)
+            pycache_dirs.append((pycache_path, get_directory_size(pycache_path)))
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
     
-    logger.info(f"Found {len(pycache_dirs)} __pycache__ directories, total size: {pycache_size:.2f} MB")
+    found_size = sum(size for _, size in pycache_dirs)
+    logger.info(f"Found {len(pycache_dirs)} __pycache__ directories, total size: {found_size:.2f} MB")
     
-    # Remove them
-    for pycache_dir in pycache_dirs:
+    # Remove them, counting only what was actually deleted
+    removed_count = 0
+    pycache_size = 0
+    for pycache_dir, dir_size in pycache_dirs:
         logger.info(f"Removing {pycache_dir}")
         try:
             shutil.rmtree(pycache_dir)
+            removed_count += 1
+            pycache_size += dir_size
         except Exception as e:
             logger.error(f"Error removing {pycache_dir}: {str(e)}")
     
-    logger.info(f"Removed {len(pycache_dirs)} __pycache__ directories, freeing {pycache_size:.2f} MB")
+    logger.info(f"Removed {removed_count} __pycache__ directories, freeing {pycache_size:.2f} MB")
+    return pycache_size
 
 def cleanup_logs(log_dir=".", max_size_mb=10):
     """Clean up log files larger than max_size_mb"""
-    log_extensions = [".log"]
     large_logs = []
     
     logger.info(f"Checking for large log files (>{max_size_mb} MB)...")
     
     for root, dirs, files in os.walk(log_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         for filename in files:
-            if any(filename.endswith(ext) for ext in log_extensions):
+            if filename.endswith(LOG_EXTENSIONS):
                 file_path = os.path.join(root, filename)
                 file_size = get_file_size(file_path)
                 
@@ -133,11 +210,11 @@ def cleanup_logs(log_dir=".", max_size_mb=10):
         logger.info(f"Truncating large log: {file_path} ({file_size:.2f} MB)")
         
         try:
-            # Instead of deleting, we'll truncate
-            with open(file_path, 'r+') as f:
-                f.seek(0)
-                f.truncate()
-                f.write(f"Log truncated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by emergency cleanup\n")
+            # Instead of deleting, we'll truncate in place (a single ftruncate,
+            # no need to open the file in text mode just to discard it)
+            os.truncate(file_path, 0)
+            with open(file_path, 'ab') as f:
+                f.write(f"Log truncated at {datetime.now():%Y-%m-%d %H:%M:%S} by emergency cleanup\n".encode())
         except Exception as e:
             logger.error(f"Error truncating {file_path}: {str(e)}")
 
@@ -149,21 +226,29 @@ def main():
     """
     logger.info("Starting storage cleanup...")
     
-    # Get initial storage info
-    total_size_before = get_directory_size(".")
-    logger.info(f"Total project size before cleanup: {total_size_before:.2f} MB")
+    # Get initial storage info. SKIP_DIRS (.git, backups, __pycache__,
+    # virtualenvs, tool caches) are pruned from this walk, so the steps that
+    # clean inside them report what they free themselves
+    skipped = ", ".join(sorted(SKIP_DIRS))
+    total_size_before = get_directory_size(".", use_cache=True)
+    logger.info(f"Project size before cleanup (excluding {skipped}): {total_size_before:.2f} MB")
     
     # Perform cleanup operations
-    cleanup_backups()
-    cleanup_git()
-    cleanup_pycache()
+    backups_saved = cleanup_backups()
+    git_saved = cleanup_git()
+    pycache_saved = cleanup_pycache()
     cleanup_logs()
     
     # Get final storage info
-    total_size_after = get_directory_size(".")
-    saved = total_size_before - total_size_after
-    logger.info(f"Total project size after cleanup: {total_size_after:.2f} MB")
-    logger.info(f"Storage saved: {saved:.2f} MB ({saved/total_size_before*100:.1f}%)")
+    total_size_after = get_directory_size(".", use_cache=True)
+    files_saved = total_size_before - total_size_after
+    saved = files_saved + backups_saved + git_saved + pycache_saved
+    logger.info(f"Project size after cleanup (excluding {skipped}): {total_size_after:.2f} MB")
+    logger.info(
+        f"Storage saved: {saved:.2f} MB (project files {files_saved:.2f} MB, "
+        f"backups {backups_saved:.2f} MB, git {git_saved:.2f} MB, "
+        f"__pycache__ {pycache_saved:.2f} MB)"
+    )
 
 if __name__ == "__main__":
     main()
@@ -5,7 +5,11 @@ import argparse
 import os
 import sys
 import logging
-from sqlalchemy.orm import Session
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import psycopg2
+from psycopg2.extras import execute_values
 
 # Set up logging
 logging.basicConfig(
@@ -17,56 +21,135 @@ logger = logging.getLogger("job_tracker.create_admin")
 # Add the current directory to the path
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from app.db.database import get_db
-from app.db import crud_user
-from app.db.models import UserRole
 from app.auth.security import get_password_hash
 
-def create_admin_user(email, password):
-    """Create a new admin user"""
-    logger.info(f"Creating admin user: {email}")
-    
+# Talk to the database directly rather than through app.db, which would load
+# the whole SQLAlchemy model graph just to insert one row. app.config only
+# resolves the settings (loading .env), so the connection string stays in one place
+from app.config import SQLALCHEMY_DATABASE_URL as DATABASE_URL
+
+# SQLAlchemy's Enum(UserRole) column stores the member name, not its value
+ADMIN_ROLE = "ADMIN"
+
+def _hash_passwords(passwords):
+    """Hash passwords, spreading the bcrypt work over all cores for bulk runs"""
+    if len(passwords) < 2:
+        return [get_password_hash(password) for password in passwords]
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(get_password_hash, passwords))
+
+def create_admin_users(credentials):
+    """Create (or promote to admin) users from a list of (email, password) pairs"""
+    # Later duplicates of the same email win
+    credentials = dict(credentials)
+    emails = list(credentials)
+    logger.info(f"Creating {len(emails)} admin user(s): {', '.join(emails)}")
+
     try:
-        # Get database session
-        db = next(get_db())
-        
-        # Check if user exists
-        existing_user = crud_user.get_user_by_email(db, email)
-        if existing_user:
-            # If user exists but is not admin, update their role
-            if existing_user.role != UserRole.ADMIN:
-                logger.info(f"User {email} exists. Updating role to ADMIN")
-                existing_user.role = UserRole.ADMIN
-                db.commit()
-                logger.info(f"User {email} updated to ADMIN role successfully")
-            else:
-                logger.info(f"User {email} already exists with ADMIN role")
-            return
-        
-        # Create new admin user
-        user = crud_user.create_user(
-            db=db, 
-            email=email, 
-            password=password, 
-            role=UserRole.ADMIN
-        )
-        
-        logger.info(f"Admin user {email} created successfully")
-        
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            with conn.cursor() as cursor:
+                # Find which users already exist
+                cursor.execute("SELECT email, role FROM users WHERE email = ANY(%s)", (emails,))
+                existing_users = dict(cursor.fetchall())
+            conn.rollback()
+
+            # Hash outside the transaction so bcrypt never holds it open
+            new_emails = [email for email in emails if email not in existing_users]
+            hashes = _hash_passwords([credentials[email] for email in new_emails])
+
+            with conn, conn.cursor() as cursor:
+                # Existing users who are not admin get their role updated
+                to_promote = [email for email, role in existing_users.items() if role != ADMIN_ROLE]
+                if to_promote:
+                    logger.info(f"Users exist. Updating role to ADMIN: {', '.join(to_promote)}")
+                    cursor.execute(
+                        "UPDATE users SET role = %s WHERE email = ANY(%s)",
+                        (ADMIN_ROLE, to_promote)
+                    )
+                for email, role in existing_users.items():
+                    if role == ADMIN_ROLE:
+                        logger.info(f"User {email} already exists with ADMIN role")
+
+                # Create all new admin users in one statement. A concurrent
+                # run may insert some of the same emails first; RETURNING
+                # reports only the rows this statement actually created
+                created = []
+                if new_emails:
+                    now = datetime.utcnow()
+                    rows = execute_values(
+                        cursor,
+                        """
+                        INSERT INTO users (email, hashed_password, role, registration_date, is_active)
+                        VALUES %s
+                        ON CONFLICT (email) DO NOTHING
+                        RETURNING email
+                        """,
+                        [(email, hashed, ADMIN_ROLE, now, True) for email, hashed in zip(new_emails, hashes)],
+                        fetch=True
+                    )
+                    created = [row[0] for row in rows]
+        finally:
+            conn.close()
+
+        for email in created:
+            logger.info(f"Admin user {email} created successfully")
+        for email in set(new_emails) - set(created):
+            logger.warning(f"User {email} was created concurrently by another process; left unchanged")
+
     except Exception as e:
-        logger.error(f"Error creating admin user: {str(e)}")
+        logger.error(f"Error creating admin users: {str(e)}")
         raise
 
+def create_admin_user(email, password):
+    """Create a new admin user"""
+    create_admin_users([(email, password)])
+
+def read_credentials_file(path):
+    """Read (email, password) pairs from a file with one 'email,password' per line
+
+    Raises ValueError naming the line if an entry is missing its email or
+    password, so a malformed file never creates an admin with an empty one.
+    """
+    credentials = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            email, _, password = line.partition(",")
+            email, password = email.strip(), password.strip()
+            if not email or not password:
+                raise ValueError(f"{path}:{line_number}: expected 'email,password' with both values set")
+            credentials.append((email, password))
+    return credentials
+
 def main():
     """Main function to create an admin user from command line"""
     parser = argparse.ArgumentParser(description="Create an admin user for Job Tracker")
-    parser.add_argument("email", help="Admin user email")
-    parser.add_argument("password", help="Admin user password")
-    
+    parser.add_argument("email", nargs="?", help="Admin user email")
+    parser.add_argument("password", nargs="?", help="Admin user password")
+    parser.add_argument("--file", dest="credentials_file",
+                        help="Create several admins from a file of 'email,password' lines")
+
     args = parser.parse_args()
-    
+
+    if args.email and not args.password:
+        parser.error("PASSWORD is required when EMAIL is given")
+
+    credentials = []
+    if args.credentials_file:
+        try:
+            credentials.extend(read_credentials_file(args.credentials_file))
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    if args.email:
+        credentials.append((args.email, args.password))
+    if not credentials:
+        parser.error("provide EMAIL PASSWORD or --file")
+
     try:
-        create_admin_user(args.email, args.password)
+        create_admin_users(credentials)
     except Exception as e:
         logger.error(f"Failed to create admin user: {str(e)}")
         sys.exit(1)
@@ -1,11 +1,13 @@
+import os
 import psycopg2
+from psycopg2 import errors
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
-# Connect to PostgreSQL server
+# Connect to PostgreSQL server (password comes from PGPASSWORD, not source)
 conn = psycopg2.connect(
     dbname='postgres',
     user='postgres',
-    password='1901',
+    password=os.environ.get('PGPASSWORD'),
     host='localhost'
 )
 conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
@@ -13,15 +15,13 @@ conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 # Create a cursor
 cursor = conn.cursor()
 
-# Check if database exists
-cursor.execute("SELECT 1 FROM pg_database WHERE datname = 'job_tracker'")
-exists = cursor.fetchone()
-
-if not exists:
-    print("Creating database 'job_tracker'...")
+# Create the database in a single round-trip; an existing database is
+# reported by the server rather than checked for up front
+print("Ensuring database 'job_tracker' exists...")
+try:
     cursor.execute("CREATE DATABASE job_tracker")
     print("Database created successfully!")
-else:
+except errors.DuplicateDatabase:
     print("Database 'job_tracker' already exists.")
 
 # Close the connection
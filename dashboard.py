@@ -7,6 +7,7 @@ import os
 import logging
 import argparse
 import pathlib
+import re
 
 # Configure logging
 logging.basicConfig(
@@ -15,21 +16,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger('job_tracker.dashboard')
 
-# Add app directory to path
-sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+# Add app directory to path. Streamlit re-executes this script on every
+# rerun, so only add it once rather than appending a duplicate each time
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
 # Import dashboard components
+# The logs, admin and tracked-jobs pages are imported where they are
+# dispatched, so anonymous visitors never load their dependencies
 from dashboard_components.jobs_page import display_jobs_page
 from dashboard_components.ai_jobs_page import display_ai_jobs_page
-from app.dashboard.logs import display_logs_page
 from app.dashboard.auth import login_page, user_settings_page, user_menu, is_authenticated, is_admin, auth_required, admin_required, check_for_auth_cookie
-from app.dashboard.user_jobs import tracked_jobs_page
-from app.dashboard.admin import admin_users_page
 # Analytics page removed as requested
 
 GA_TRACKING_ID = "G-EGVJQG5M34"
 
-GA_SNIPPET = f"""<!-- Google tag (gtag.js) -->
+# gtag calls queue in dataLayer until gtag.js arrives, so the library itself
+# is fetched once the browser is idle instead of competing with first paint
+GA_SNIPPET = f"""<!-- Google tag (gtag.js), loaded when idle -->
+<script>
+  window.dataLayer = window.dataLayer || [];
+  function gtag(){{dataLayer.push(arguments);}}
+  gtag('js', new Date());
+  gtag('config', '{GA_TRACKING_ID}');
+  (window.requestIdleCallback || function(cb){{ return setTimeout(cb, 1); }})(function(){{
+    var s = document.createElement('script');
+    s.async = true;
+    s.src = 'https://www.googletagmanager.com/gtag/js?id={GA_TRACKING_ID}';
+    document.head.appendChild(s);
+  }}, {{timeout: 3000}});
+</script>"""
+
+# Snippet written by earlier versions; replaced in place when found
+_LEGACY_GA_SNIPPET = f"""<!-- Google tag (gtag.js) -->
 <script async src="https://www.googletagmanager.com/gtag/js?id={GA_TRACKING_ID}"></script>
 <script>
   window.dataLayer = window.dataLayer || [];
@@ -45,15 +65,20 @@ def _inject_ga_into_streamlit_index():
     Streamlit's st.markdown strips <script> tags and st.components.v1.html
     renders inside an iframe, so neither can place the GA tag in the main
     document.  The only reliable approach is to modify the served index.html
-    directly.  The patch is idempotent — it checks for the tracking ID before
-    writing.
+    directly.  The patch is idempotent — it checks for the snippet before
+    writing, and upgrades the snippet older versions wrote.
     """
     index_path = pathlib.Path(st.__file__).parent / "static" / "index.html"
     try:
         html = index_path.read_text(encoding="utf-8")
-        if GA_TRACKING_ID in html:
+        if GA_SNIPPET in html:
             return  # already patched
-        html = html.replace("<head>", f"<head>\n{GA_SNIPPET}", 1)
+        if _LEGACY_GA_SNIPPET in html:
+            html = html.replace(_LEGACY_GA_SNIPPET, GA_SNIPPET, 1)
+        elif GA_TRACKING_ID in html:
+            return  # patched by hand or by another tool; leave it alone
+        else:
+            html = html.replace("<head>", f"<head>\n{GA_SNIPPET}", 1)
         index_path.write_text(html, encoding="utf-8")
         logger.info("Google Analytics tag injected into Streamlit index.html")
     except Exception as e:
@@ -63,15 +88,47 @@ def _inject_ga_into_streamlit_index():
 _inject_ga_into_streamlit_index()
 
 
+@st.cache_data(show_spinner=False)
+def _load_style_bundle():
+    """Return custom.css and (if present) css/compact.css in one <style> block
+
+    Built and minified once per server process, so each rerun emits a single
+    cached element.
+    """
+    from dashboard_components.utils import read_static_file
+    sheets = [read_static_file("custom.css"), read_static_file("css", "compact.css")]
+    return "<style>" + _minify_css("\n".join(sheet for sheet in sheets if sheet is not None)) + "</style>"
+
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet
+
+    Deliberately conservative: whitespace is only removed next to characters
+    where it can never be significant, so selectors like "a :hover" keep
+    their meaning.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Job Tracker Dashboard')
     parser.add_argument('--api-url', dest='api_url', 
                         help='API URL (e.g., https://api.example.com/api)')
-    return parser.parse_args()
+    # Ignore unrelated arguments: this now runs at import time, where the
+    # process argv may belong to something else (e.g. a test runner)
+    return parser.parse_known_args()[0]
 
-def main():
-    """Main dashboard application entry point"""
+@st.cache_resource(show_spinner=False)
+def _configure_api_url():
+    """Set JOB_TRACKER_API_URL from the command line, once per server process
+
+    Streamlit re-executes this script on every interaction; the cache keeps
+    the argument parsing and env/log writes from repeating on each rerun.
+    """
     # Parse command line arguments
     args = parse_arguments()
     
@@ -83,7 +140,11 @@ def main():
         # Force API URL to port 8001 if not explicitly set
         os.environ['JOB_TRACKER_API_URL'] = 'http://localhost:8001/api'
         logger.info(f"Setting default API URL to: http://localhost:8001/api")
-    
+
+_configure_api_url()
+
+def main():
+    """Main dashboard application entry point"""
     # Setup page configuration - MUST be the first Streamlit command
     st.set_page_config(
         page_title="Job Tracker Dashboard",
@@ -97,30 +158,15 @@ def main():
         # Try to restore session from cookie
         check_for_auth_cookie()
     
-    # Load custom CSS
-    with open(os.path.join(os.path.dirname(__file__), "static", "custom.css")) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-        
-    # Load compact CSS for more compact tables and UI elements
-    compact_css_path = os.path.join(os.path.dirname(__file__), "static", "css", "compact.css")
-    if os.path.exists(compact_css_path):
-        with open(compact_css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-    
-    # Load custom JavaScript for more compact job listings
-    with open(os.path.join(os.path.dirname(__file__), "static", "compact_jobs.js")) as f:
-        st.markdown(f"<script>{f.read()}</script>", unsafe_allow_html=True)
-        
-    # Load simplified analytics helper functions
-    with open(os.path.join(os.path.dirname(__file__), "static", "analytics.js")) as f:
-        st.markdown(f"<script>{f.read()}</script>", unsafe_allow_html=True)
-        
-    # GA tag is injected into Streamlit's index.html at module load time
-    # (see _inject_ga_into_streamlit_index above)
+    # Load custom CSS and the compact table/UI CSS as one cached block
+    st.markdown(_load_style_bundle(), unsafe_allow_html=True)
     
-    # API URL is configured behind the scenes
-    from dashboard_components.utils import get_api_url
-    current_api_url = get_api_url()
+    # No <script> blocks go through st.markdown: they are never executed
+    # there, so they only added payload to every rerun. The GA tag is
+    # injected into Streamlit's index.html at module load time
+    # (see _inject_ga_into_streamlit_index above). The style block itself
+    # has to be re-emitted each rerun: Streamlit removes any element a
+    # rerun doesn't produce again, so it can't be gated on session state
     
     # Initialize session state for page navigation if not exists
     if 'page' not in st.session_state:
@@ -172,10 +218,12 @@ def main():
     elif current_page == 'ai_jobs':
         display_ai_jobs_page()
     elif current_page == 'tracked_jobs':
+        from app.dashboard.user_jobs import tracked_jobs_page
         tracked_jobs_page()
     elif current_page == 'admin_users':
         # Check if user is admin for protected pages
         if is_admin():
+            from app.dashboard.admin import admin_users_page
             admin_users_page()
         else:
             st.error("You don't have permission to view this page")
@@ -184,6 +232,7 @@ def main():
     elif current_page == 'system_logs':
         # Check if user is admin for protected pages
         if is_admin():
+            from app.dashboard.logs import display_logs_page
             display_logs_page()
         else:
             st.error("You don't have permission to view this page")
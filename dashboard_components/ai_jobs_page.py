@@ -10,9 +10,12 @@ import logging
 import traceback
 
 from dashboard_components.utils import (
+    fetch_companies,
+    fetch_concurrently,
     fetch_data,
-    fetch_data_with_params,
-    get_api_url
+    fetch_job_stats,
+    get_api_url,
+    jobs_to_dataframe
 )
 from app.dashboard.auth import is_authenticated
 from dashboard_components.custom_jobs_table import display_custom_jobs_table
@@ -63,11 +66,6 @@ AI_TITLE_PATTERNS = [
 _AI_PATTERN = re.compile("|".join(AI_TITLE_PATTERNS), re.IGNORECASE)
 
 
-def _is_ai_ds_title(title: str) -> bool:
-    """Return True if the job title looks like an AI/DS role."""
-    return bool(_AI_PATTERN.search(title or ""))
-
-
 # ---------------------------------------------------------------------------
 # Target roles – these are the exact Role.name values stored in the database
 # (after crud.clean_role_name() normalisation).
@@ -121,6 +119,11 @@ ROLE_DISPLAY_LABELS = {
 }
 
 
+def _remember_time_periods():
+    """Copy the time period selection to a key that outlives the widget"""
+    st.session_state.ai_time_period_selection = st.session_state.ai_time_periods
+
+
 def display_ai_jobs_page():
     """Display the AI & Data Science jobs page with pre-applied role filters."""
     dashboard_start = time.time()
@@ -131,9 +134,12 @@ def display_ai_jobs_page():
         "filtered automatically so you can focus on what matters."
     )
 
+    # Stats and the company list are independent, so fetch them together
+    stats, companies_data = fetch_concurrently(fetch_job_stats, fetch_companies)
+
     # -- Stats row -------------------------------------------------------
     try:
-        stats = fetch_data("jobs/stats") or {}
+        stats = stats or {}
         if stats and not stats.get("error"):
             metrics_cols = st.columns(3)
             metrics_cols[0].metric("Total Active Jobs (all)", stats.get("total_active_jobs", 0))
@@ -166,25 +172,21 @@ def display_ai_jobs_page():
         {"label": "Last 7 days", "days": 7, "key": "days_7"},
     ]
 
-    if "ai_time_filters" not in st.session_state:
-        st.session_state.ai_time_filters = {"days_7": True}
-
-    selected_time_keys = []
-    for option in time_options:
-        key = f"ai_time_{option['key']}"
-        is_checked = st.sidebar.checkbox(
-            option["label"],
-            value=st.session_state.ai_time_filters.get(option["key"], False),
-            key=key,
-        )
-        st.session_state.ai_time_filters[option["key"]] = is_checked
-        if is_checked:
-            selected_time_keys.append(option["key"])
-
-    if not selected_time_keys:
-        selected_time_keys = ["days_7"]
-        st.session_state.ai_time_filters = {"days_7": True}
-        st.rerun()
+    # One multiselect rather than a checkbox per period; an emptied
+    # selection falls back to 7 days without an extra rerun
+    time_labels = {o["key"]: o["label"] for o in time_options}
+    # The widget's own state is dropped while another page is shown, so the
+    # selection is kept under a plain session key and restored from it
+    if not st.session_state.get("ai_time_periods"):
+        st.session_state.ai_time_periods = st.session_state.get("ai_time_period_selection") or ["days_7"]
+    selected_time_keys = st.sidebar.multiselect(
+        "Show jobs posted",
+        options=list(time_labels),
+        format_func=time_labels.get,
+        key="ai_time_periods",
+        on_change=_remember_time_periods,
+        label_visibility="collapsed",
+    ) or ["days_7"]
 
     max_days = 1
     for option in time_options:
@@ -206,7 +208,7 @@ def display_ai_jobs_page():
     # Search and company filters
     search_term = st.sidebar.text_input("Search by Keyword", key="ai_search")
 
-    companies_data = fetch_data("jobs/companies") or {"companies": []}
+    companies_data = companies_data or {"companies": []}
     companies = sorted(companies_data["companies"])
     selected_companies = st.sidebar.multiselect(
         "Companies (select multiple)", companies, default=[], key="ai_companies"
@@ -215,7 +217,7 @@ def display_ai_jobs_page():
     if search_term or selected_companies:
         if st.sidebar.button("Clear Filters", key="ai_clear"):
             for k in list(st.session_state.keys()):
-                if k.startswith("ai_") and k != "ai_time_filters":
+                if k.startswith("ai_") and k not in ("ai_time_periods", "ai_time_period_selection"):
                     del st.session_state[k]
             st.rerun()
 
@@ -230,14 +232,14 @@ def display_ai_jobs_page():
         request_params.append(("search", search_term))
 
     # -- Fetch jobs ------------------------------------------------------
-    jobs_data = fetch_data_with_params("jobs", request_params) or {"jobs": [], "total": 0}
+    jobs_data = fetch_data("jobs", request_params) or {"jobs": [], "total": 0}
     # Note: total shown after client-side title filter is applied below
     api_total = jobs_data.get("total", 0)
 
     # -- Process & display -----------------------------------------------
     if jobs_data.get("jobs"):
         try:
-            df_jobs = pd.DataFrame(jobs_data["jobs"])
+            df_jobs = jobs_to_dataframe(jobs_data["jobs"])
 
             # ---------------------------------------------------------------
             # Client-side title filter – remove jobs whose titles don't match
@@ -246,7 +248,7 @@ def display_ai_jobs_page():
             # ---------------------------------------------------------------
             if "job_title" in df_jobs.columns:
                 before = len(df_jobs)
-                df_jobs = df_jobs[df_jobs["job_title"].apply(_is_ai_ds_title)]
+                df_jobs = df_jobs[df_jobs["job_title"].str.contains(_AI_PATTERN, na=False)]
                 removed = before - len(df_jobs)
                 if removed:
                     logger.info(f"Title filter removed {removed} non-AI/DS jobs from display")
@@ -259,7 +261,6 @@ def display_ai_jobs_page():
 
             # Client-side date filtering
             if "date_posted" in df_jobs.columns:
-                df_jobs["date_posted"] = pd.to_datetime(df_jobs["date_posted"])
                 date_masks = []
                 for key in selected_time_keys:
                     if key == "today":
@@ -281,26 +282,25 @@ def display_ai_jobs_page():
 
             # Charts
             if "date_posted" in df_jobs.columns and len(df_jobs) > 0:
-                df_jobs["date_posted"] = pd.to_datetime(df_jobs["date_posted"])
                 viz_col1, viz_col2 = st.columns(2)
 
                 with viz_col1:
                     if "roles" in df_jobs.columns:
                         roles_df = df_jobs.explode("roles")
                         # Replace long internal names with display labels
-                        roles_df["roles"] = roles_df["roles"].map(
-                            lambda r: ROLE_DISPLAY_LABELS.get(r, r) if r else r
-                        )
-                        roles_df["count"] = 1
+                        # then store them as a categorical for the groupby
+                        roles_df["roles"] = roles_df["roles"].replace(ROLE_DISPLAY_LABELS).astype("category")
+                        # Filter to the top roles before aggregating
+                        top_roles = roles_df["roles"].value_counts().nlargest(10).index.tolist()
+                        roles_df = roles_df[roles_df["roles"].isin(top_roles)]
                         roles_viz_df = (
                             roles_df.groupby(
-                                [pd.Grouper(key="date_posted", freq="D"), "roles"]
-                            )["count"]
-                            .sum()
-                            .reset_index()
+                                [pd.Grouper(key="date_posted", freq="D"), "roles"],
+                                observed=True,
+                            )
+                            .size()
+                            .reset_index(name="count")
                         )
-                        top_roles = roles_df["roles"].value_counts().nlargest(10).index.tolist()
-                        roles_viz_df = roles_viz_df[roles_viz_df["roles"].isin(top_roles)]
 
                         fig1 = px.bar(
                             roles_viz_df,
@@ -5,7 +5,8 @@ import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
 import html as html_lib
-from dashboard_components.utils import format_job_date
+import math
+from dashboard_components.utils import format_job_dates
 from app.dashboard.auth import is_authenticated, get_current_user
 from app.db.database import get_db
 from app.db.models import UserJob, Job, User
@@ -14,23 +15,45 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows rendered per page of the jobs table
+PAGE_SIZE = 100
+
+# Columns _render_jobs_html reads
+TABLE_COLUMNS = [
+    "id", "job_title", "company", "location", "date_posted",
+    "first_seen", "employment_type", "job_url",
+]
+
 
 def _get_user_by_email(db, email):
     return db.query(User).filter(User.email == email).first()
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_applied_job_ids(user_email):
+    # Cached per user so filter/page reruns don't hit the DB each time.
+    # Errors propagate (and so are not cached); mark_job_applied clears the
+    # user's entry after a write.
+    db = next(get_db())
+    user = _get_user_by_email(db, user_email)
+    if not user:
+        return set()
+    rows = db.query(UserJob.job_id).filter(
+        UserJob.user_id == user.id,
+        UserJob.is_applied == True,  # noqa: E712
+    ).all()
+    return {r.job_id for r in rows}
+
+
+def forget_applied_jobs(user_email):
+    """Drop the cached applied-job ids for a user after their status changes."""
+    _load_applied_job_ids.clear(user_email)
+
+
 def get_tracked_jobs(user_email):
-    """Return a set of job-id strings the user has already applied to."""
+    """Return the set of (integer) job ids the user has already applied to."""
     try:
-        db = next(get_db())
-        user = _get_user_by_email(db, user_email)
-        if not user:
-            return set()
-        rows = db.query(UserJob.job_id).filter(
-            UserJob.user_id == user.id,
-            UserJob.is_applied == True,  # noqa: E712
-        ).all()
-        return {str(r.job_id) for r in rows}
+        return _load_applied_job_ids(user_email)
     except Exception as e:
         logger.error(f"Error getting tracked jobs: {e}")
         return set()
@@ -65,6 +88,7 @@ def mark_job_applied(user_email, job_id):
             db.add(user_job)
 
         db.commit()
+        forget_applied_jobs(user_email)
         return True
     except Exception as e:
         logger.error(f"Error marking job applied: {e}")
@@ -72,116 +96,40 @@ def mark_job_applied(user_email, job_id):
         return False
 
 
-def display_custom_jobs_table(df_jobs):
-    """Render the jobs table.
-
-    Logged-in users: clicking "Apply Now" opens the external URL *and*
-    marks the job as applied in the DB.  Already-applied jobs show a
-    green "Applied" button instead of blue.
-    """
-
-    user_email = None
-    if is_authenticated():
-        user = get_current_user()
-        if user and "email" in user:
-            user_email = user["email"]
-
-    applied_ids: set = set()
-    if user_email:
-        applied_ids = get_tracked_jobs(user_email)
-
-    # --- Handle incoming "mark applied" callback via query params ----------
-    if user_email and "mark_applied" in st.query_params:
-        job_id_str = st.query_params["mark_applied"]
-        if job_id_str not in applied_ids:
-            mark_job_applied(user_email, int(job_id_str))
-            applied_ids.add(job_id_str)
-        st.query_params.clear()
-
-    st.header("Job Listings")
-
-    # --- Sort ---------------------------------------------------------------
-    if "first_seen" in df_jobs.columns:
-        df_jobs = df_jobs.sort_values(by="first_seen", ascending=False)
-    else:
-        df_jobs = df_jobs.sort_values(by="date_posted", ascending=False)
-
-    # --- Build HTML table rows ----------------------------------------------
-    rows_html = ""
-    for _, row in df_jobs.iterrows():
-        job_id = str(row["id"])
-        date_posted = html_lib.escape(str(format_job_date(row.get("first_seen", row["date_posted"]))))
-        job_url = html_lib.escape(row["job_url"].strip() if isinstance(row.get("job_url"), str) else "#")
-        title = html_lib.escape(str(row["job_title"]))
-        company = html_lib.escape(str(row["company"]))
-        location = html_lib.escape(str(row["location"]))
-        job_type = html_lib.escape(str(row.get("employment_type", "N/A")))
-        already_applied = job_id in applied_ids
-
-        if user_email:
-            if already_applied:
-                btn = (
-                    f"<a href='{job_url}' target='_blank' "
-                    f"class='apply-btn apply-btn-done'>Applied</a>"
-                )
-            else:
-                btn = (
-                    f"<a href='{job_url}' target='_blank' "
-                    f"class='apply-btn apply-btn-new' "
-                    f"data-job-id='{job_id}'>Apply Now</a>"
-                )
-        else:
-            btn = (
-                f"<a href='{job_url}' target='_blank' "
-                f"class='apply-btn apply-btn-new'>Apply Now</a>"
-            )
-
-        rows_html += (
-            f"<tr>"
-            f"<td>{title}</td>"
-            f"<td>{company}</td>"
-            f"<td>{location}</td>"
-            f"<td>{date_posted}</td>"
-            f"<td>{job_type}</td>"
-            f"<td style='text-align:center'>{btn}</td>"
-            f"</tr>\n"
-        )
-
-    num_rows = len(df_jobs)
-    table_height = min(60 + num_rows * 42, 2000)
-
-    full_html = f"""
+# Static parts of the table document, kept out of the per-render code so
+# they are built once at import rather than re-formatted on every call
+_TABLE_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: "Source Sans Pro", sans-serif; font-size: 0.9rem; color: #fafafa; background: transparent; }}
-        table {{ width: 100%; border-collapse: collapse; table-layout: fixed; }}
-        th {{ background-color: #1E1E1E; color: white; text-align: left; padding: 8px;
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: "Source Sans Pro", sans-serif; font-size: 0.9rem; color: #fafafa; background: transparent; }
+        table { width: 100%; border-collapse: collapse; table-layout: fixed; }
+        th { background-color: #1E1E1E; color: white; text-align: left; padding: 8px;
               font-size: 0.9rem; font-weight: bold; border-bottom: 1px solid #444;
-              position: sticky; top: 0; z-index: 2; }}
-        td {{ padding: 8px; border-bottom: 1px solid #333; vertical-align: middle;
-              overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
-        tr:hover {{ background-color: rgba(200, 200, 200, 0.1); }}
-
-        th:nth-child(1), td:nth-child(1) {{ width: 25%; }}
-        th:nth-child(2), td:nth-child(2) {{ width: 18%; }}
-        th:nth-child(3), td:nth-child(3) {{ width: 17%; }}
-        th:nth-child(4), td:nth-child(4) {{ width: 20%; font-weight: bold; }}
-        th:nth-child(5), td:nth-child(5) {{ width: 12%; }}
-        th:nth-child(6), td:nth-child(6) {{ width: 8%; text-align: center; }}
-
-        .apply-btn {{
+              position: sticky; top: 0; z-index: 2; }
+        td { padding: 8px; border-bottom: 1px solid #333; vertical-align: middle;
+              overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+        tr:hover { background-color: rgba(200, 200, 200, 0.1); }
+
+        th:nth-child(1), td:nth-child(1) { width: 25%; }
+        th:nth-child(2), td:nth-child(2) { width: 18%; }
+        th:nth-child(3), td:nth-child(3) { width: 17%; }
+        th:nth-child(4), td:nth-child(4) { width: 20%; font-weight: bold; }
+        th:nth-child(5), td:nth-child(5) { width: 12%; }
+        th:nth-child(6), td:nth-child(6) { width: 8%; text-align: center; }
+
+        .apply-btn {
             display: inline-block; padding: 4px 10px;
             text-decoration: none; border-radius: 4px;
             font-size: 0.78rem; text-align: center;
             min-width: 80px; cursor: pointer; border: none;
             transition: background-color 0.3s;
-        }}
-        .apply-btn:hover {{ opacity: 0.85; }}
-        .apply-btn-new {{ background-color: #1E90FF; color: white; }}
-        .apply-btn-done {{ background-color: #4CAF50; color: white; }}
+        }
+        .apply-btn:hover { opacity: 0.85; }
+        .apply-btn-new { background-color: #1E90FF; color: white; }
+        .apply-btn-done { background-color: #4CAF50; color: white; }
     </style>
     </head>
     <body>
@@ -193,12 +141,14 @@ def display_custom_jobs_table(df_jobs):
             </tr>
         </thead>
         <tbody>
-            {rows_html}
+"""
+
+_TABLE_TAIL = """
         </tbody>
     </table>
     <script>
-        document.querySelectorAll('a.apply-btn-new[data-job-id]').forEach(function(btn) {{
-            btn.addEventListener('click', function(e) {{
+        document.querySelectorAll('a.apply-btn-new[data-job-id]').forEach(function(btn) {
+            btn.addEventListener('click', function(e) {
                 var jobId = this.getAttribute('data-job-id');
 
                 // Immediately flip the button to green "Applied"
@@ -208,18 +158,142 @@ def display_custom_jobs_table(df_jobs):
                 this.removeAttribute('data-job-id');
 
                 // Tell Streamlit (parent frame) to persist via query param
-                try {{
+                try {
                     var parentUrl = new URL(window.parent.location.href);
                     parentUrl.searchParams.set('mark_applied', jobId);
                     window.parent.location.href = parentUrl.toString();
-                }} catch(err) {{
+                } catch(err) {
                     console.error('Could not notify parent:', err);
-                }}
-            }});
-        }});
+                }
+            });
+        });
     </script>
     </body>
     </html>
+"""
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _render_jobs_html(df_jobs, applied_ids):
+    """Build the table document for one page of jobs.
+
+    applied_ids is the frozenset of applied (integer) job ids for a logged-in
+    user, or None for visitors (no tracking attributes on the buttons).
+    Cached so reruns that don't change the page or the applied set (sidebar
+    navigation, unrelated widgets) reuse the string; the TTL bounds how stale
+    the relative "N mins ago" dates can get.
+    """
+    # Each cell is built column-wise with pandas string ops rather than per row
+    def _escape(value):
+        return html_lib.escape(str(value))
+
+    def _escaped(column, default=""):
+        # Missing values (NaN in the categorical columns) show the default
+        # rather than a literal "nan"
+        if column not in df_jobs.columns:
+            return pd.Series(_escape(default), index=df_jobs.index)
+        values = df_jobs[column]
+        return values.map(_escape).astype(str).where(values.notna(), _escape(default))
+
+    date_source = df_jobs["first_seen"] if "first_seen" in df_jobs.columns else df_jobs["date_posted"]
+    date_posted = format_job_dates(date_source).map(_escape)
+    if "job_url" in df_jobs.columns:
+        urls = df_jobs["job_url"].map(lambda url: url.strip() if isinstance(url, str) else "#")
+    else:
+        urls = pd.Series("#", index=df_jobs.index)
+    job_url = urls.map(html_lib.escape)
+
+    link_open = "<a href='" + job_url + "' target='_blank' "
+    if applied_ids is not None:
+        applied_btn = link_open + "class='apply-btn apply-btn-done'>Applied</a>"
+        new_btn = link_open + "class='apply-btn apply-btn-new' data-job-id='" + df_jobs["id"].map(str) + "'>Apply Now</a>"
+        btn = applied_btn.where(df_jobs["id"].isin(applied_ids), new_btn)
+    else:
+        btn = link_open + "class='apply-btn apply-btn-new'>Apply Now</a>"
+
+    rows_html = "".join(
+        "<tr>"
+        + "<td>" + _escaped("job_title") + "</td>"
+        + "<td>" + _escaped("company") + "</td>"
+        + "<td>" + _escaped("location") + "</td>"
+        + "<td>" + date_posted + "</td>"
+        + "<td>" + _escaped("employment_type", "N/A") + "</td>"
+        + "<td>" + btn + "</td>"
+        + "</tr>\n"
+    )
+
+    return _TABLE_HEAD + rows_html + _TABLE_TAIL
+
+
+@st.fragment
+def display_custom_jobs_table(df_jobs):
+    """Render the jobs table.
+
+    Logged-in users: clicking "Apply Now" opens the external URL *and*
+    marks the job as applied in the DB.  Already-applied jobs show a
+    green "Applied" button instead of blue.
+
+    Runs as a fragment, so paging through the table reruns only this
+    function (with the same df_jobs) instead of refetching and replotting
+    the whole page.
     """
 
+    user_email = None
+    if is_authenticated():
+        user = get_current_user()
+        if user and "email" in user:
+            user_email = user["email"]
+
+    applied_ids: set = set()
+    if user_email:
+        applied_ids = get_tracked_jobs(user_email)
+
+    # --- Handle incoming "mark applied" callback via query params ----------
+    if user_email and "mark_applied" in st.query_params:
+        job_id = int(st.query_params["mark_applied"])
+        if job_id not in applied_ids:
+            mark_job_applied(user_email, job_id)
+            applied_ids.add(job_id)
+        st.query_params.clear()
+
+    st.header("Job Listings")
+
+    # The time-period filter can leave nothing to show; skip building an
+    # empty table document
+    if df_jobs.empty:
+        st.info("No job listings match your criteria")
+        return
+
+    # --- Sort ---------------------------------------------------------------
+    # Sorted on the raw timestamps, before anything is formatted for display.
+    # The jobs API returns rows newest-first by first_seen already, in which
+    # case the O(N) monotonic check lets us skip the sort.
+    sort_column = "first_seen" if "first_seen" in df_jobs.columns else "date_posted"
+    if not df_jobs[sort_column].is_monotonic_decreasing:
+        df_jobs = df_jobs.sort_values(by=sort_column, ascending=False)
+
+    # --- Paginate -----------------------------------------------------------
+    # Only one page of rows is turned into HTML and sent to the browser
+    total_rows = len(df_jobs)
+    num_pages = max(1, math.ceil(total_rows / PAGE_SIZE))
+    if num_pages > 1:
+        # A narrower filter can leave a stale page number beyond the last page
+        if st.session_state.get("jobs_table_page", 1) > num_pages:
+            st.session_state["jobs_table_page"] = 1
+        page = st.number_input(
+            f"Page (1-{num_pages})", min_value=1, max_value=num_pages,
+            step=1, key="jobs_table_page",
+        )
+        start = (page - 1) * PAGE_SIZE
+        df_jobs = df_jobs.iloc[start:start + PAGE_SIZE]
+        st.caption(f"Showing jobs {start + 1}-{start + len(df_jobs)} of {total_rows}")
+
+    # --- Render ---------------------------------------------------------------
+    tracked_ids = frozenset(applied_ids) if user_email else None
+    # Only the rendered columns go into the cache key; the list-valued roles
+    # column can't be hashed directly and would force a pickle fallback
+    table_columns = [c for c in TABLE_COLUMNS if c in df_jobs.columns]
+    full_html = _render_jobs_html(df_jobs[table_columns], tracked_ids)
+    table_height = min(60 + len(df_jobs) * 42, 2000)
+
     components.html(full_html, height=table_height, scrolling=True)
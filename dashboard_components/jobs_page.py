@@ -10,9 +10,12 @@ import logging
 import traceback
 
 from dashboard_components.utils import (
+    fetch_companies,
+    fetch_concurrently,
     fetch_data,
-    fetch_data_with_params,
-    get_api_url
+    fetch_job_stats,
+    get_api_url,
+    jobs_to_dataframe
 )
 from app.dashboard.auth import is_authenticated
 from dashboard_components.custom_jobs_table import display_custom_jobs_table
@@ -20,6 +23,10 @@ from dashboard_components.custom_jobs_table import display_custom_jobs_table
 # Configure logging
 logger = logging.getLogger('job_tracker.dashboard.jobs_page')
 
+def _remember_time_periods():
+    """Copy the time period selection to a key that outlives the widget"""
+    st.session_state.time_period_selection = st.session_state.time_periods
+
 def display_jobs_page():
     """Display the main jobs page in the Streamlit dashboard"""
     # Start timing the dashboard rendering
@@ -31,9 +38,12 @@ def display_jobs_page():
     # Sidebar filters
     st.sidebar.header("Filters")
 
+    # Stats and the company list are independent, so fetch them together
+    stats, companies_data = fetch_concurrently(fetch_job_stats, fetch_companies)
+
     # Get job statistics for display
     try:
-        stats = fetch_data("jobs/stats") or {}
+        stats = stats or {}
         if stats and not stats.get("error"):
             # Create a metrics row
             metrics_cols = st.columns(3)
@@ -48,7 +58,7 @@ def display_jobs_page():
         logger.error(f"Error displaying job statistics: {str(e)}")
 
     # Fetch filter data (companies)
-    companies_data = fetch_data("jobs/companies") or {"companies": []}
+    companies_data = companies_data or {"companies": []}
 
     # Time period selector with multiple selection options
     st.sidebar.subheader("Time Period")
@@ -64,29 +74,24 @@ def display_jobs_page():
         {"label": "Last 7 days", "days": 7, "key": "days_7"},
     ]
 
-    # Initialize session state for time filters if not present
-    if "time_filters" not in st.session_state:
-        st.session_state.time_filters = {"days_7": True}  # Default to 7 days
-
-    # Create checkboxes for each time option
-    selected_time_keys = []
-    for option in time_options:
-        key = f"time_{option['key']}"
-        is_checked = st.sidebar.checkbox(
-            option["label"],
-            value=st.session_state.time_filters.get(option["key"], False),
-            key=key
-        )
-        # Update session state
-        st.session_state.time_filters[option["key"]] = is_checked
-        if is_checked:
-            selected_time_keys.append(option["key"])
-
-    # If nothing selected, default to 7 days
-    if not selected_time_keys:
-        selected_time_keys = ["days_7"]
-        st.session_state.time_filters = {"days_7": True}
-        st.rerun()
+    # A single multiselect instead of one checkbox per period keeps this to
+    # one widget (and one session-state entry). An emptied selection falls
+    # back to 7 days; setting the widget's state before it is created avoids
+    # an extra rerun.
+    time_labels = {option["key"]: option["label"] for option in time_options}
+    # Streamlit drops a widget's state on any run it isn't drawn in (i.e.
+    # while another page is shown), so the selection is also kept under a
+    # plain session key and copied back before the widget is created.
+    if not st.session_state.get("time_periods"):
+        st.session_state.time_periods = st.session_state.get("time_period_selection") or ["days_7"]
+    selected_time_keys = st.sidebar.multiselect(
+        "Show jobs posted",
+        options=list(time_labels),
+        format_func=time_labels.get,
+        key="time_periods",
+        on_change=_remember_time_periods,
+        label_visibility="collapsed",
+    ) or ["days_7"]
 
     # Calculate the maximum days to fetch based on selected options
     max_days = 1  # Default minimum
@@ -141,66 +146,48 @@ def display_jobs_page():
     request_params.append(("limit", 1000))
 
     # Fetch job listings with custom params
-    jobs_data = fetch_data_with_params("jobs", request_params) or {"jobs": [], "total": 0}
+    jobs_data = fetch_data("jobs", request_params) or {"jobs": [], "total": 0}
 
     # Show total job count with improved styling
     total_jobs = jobs_data.get("total", 0)
     st.markdown(f"<h4 class='job-listing-header' style='margin-bottom:0; padding-bottom:0;'>Found {total_jobs} jobs matching your criteria</h4>", unsafe_allow_html=True)
 
-    # Add analytics tracking for search
-    if search_term:
-        st.markdown(f"<script>trackSearch('{search_term}', {total_jobs});</script>", unsafe_allow_html=True)
-
     # Process data for visualization and display
     if jobs_data.get("jobs"):
         try:
-            df_jobs = pd.DataFrame(jobs_data["jobs"])
+            df_jobs = jobs_to_dataframe(jobs_data["jobs"])
 
-            # Convert date_posted to datetime for filtering
+            # date_posted is already parsed to datetime by jobs_to_dataframe
             if "date_posted" in df_jobs.columns:
-                # Log a sample of dates for debugging
-                if len(df_jobs) > 0:
-                    sample_dates = df_jobs["date_posted"].head(3).tolist()
-                    logger.info(f"Sample date_posted values: {sample_dates}")
-
-                # Convert to datetime
-                df_jobs["date_posted"] = pd.to_datetime(df_jobs["date_posted"])
-
-                # Log converted dates
-                if len(df_jobs) > 0:
-                    sample_converted = df_jobs["date_posted"].head(3).tolist()
-                    logger.info(f"Sample converted dates: {sample_converted}")
+                # Debug output only; skip building it unless it will be logged
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug(f"Sample date_posted values: {df_jobs['date_posted'].head(3).tolist()}")
 
                 # Apply client-side time filtering based on selected time periods
                 if selected_time_keys:
-                    # Create a mask for each selected time period
+                    # Create a mask for each selected time period, comparing
+                    # just the date part (normalized once for all periods)
+                    posted_day = df_jobs["date_posted"].dt.normalize()
                     date_masks = []
 
                     for key in selected_time_keys:
                         if key == "today":
-                            # Today's jobs - use normalize() to compare just the date part
-                            mask = df_jobs["date_posted"].dt.normalize() == pd.Timestamp(today)
-                            date_masks.append(mask)
-                            # Log for debugging
-                            today_count = mask.sum()
-                            logger.info(f"Today's jobs count: {today_count}")
+                            # Today's jobs
+                            mask = posted_day == pd.Timestamp(today)
                         elif key == "yesterday":
                             # Yesterday's jobs
-                            mask = df_jobs["date_posted"].dt.normalize() == pd.Timestamp(today - timedelta(days=1))
-                            date_masks.append(mask)
-                            # Log for debugging
-                            yesterday_count = mask.sum()
-                            logger.info(f"Yesterday's jobs count: {yesterday_count}")
+                            mask = posted_day == pd.Timestamp(today - timedelta(days=1))
                         elif key.startswith("days_"):
                             # Last N days jobs
                             days = int(key.split("_")[1])
-                            # Use normalize() to compare just the date part
                             cutoff_date = pd.Timestamp(today - timedelta(days=days-1))
-                            mask = df_jobs["date_posted"].dt.normalize() >= cutoff_date
-                            date_masks.append(mask)
-                            # Log for debugging
-                            days_count = mask.sum()
-                            logger.info(f"Last {days} days jobs count: {days_count}")
+                            mask = posted_day >= cutoff_date
+                        else:
+                            continue
+                        date_masks.append(mask)
+                        if debug_enabled:
+                            logger.debug(f"{time_labels[key]} jobs count: {mask.sum()}")
 
                     # Combine all masks with OR operation
                     if date_masks:
@@ -213,9 +200,6 @@ def display_jobs_page():
 
             # Create visualizations
             if "date_posted" in df_jobs.columns:
-                # Convert to datetime
-                df_jobs["date_posted"] = pd.to_datetime(df_jobs["date_posted"])
-
                 # Setup the visualization layout
                 viz_col1, viz_col2 = st.columns(2)
 
@@ -224,17 +208,19 @@ def display_jobs_page():
                     if "roles" in df_jobs.columns:
                         # Explode roles to handle multiple roles per job
                         roles_df = df_jobs.explode("roles")
+                        # Few distinct roles: group on integer category codes
+                        roles_df["roles"] = roles_df["roles"].astype("category")
+
+                        # Only keep the top 7 roles for clarity, filtering
+                        # before the groupby so only plotted rows are counted
+                        top_roles = roles_df["roles"].value_counts().nlargest(7).index.tolist()
+                        roles_df = roles_df[roles_df["roles"].isin(top_roles)]
 
                         # Count by date and role
-                        roles_df["count"] = 1
                         roles_viz_df = roles_df.groupby([
                             pd.Grouper(key="date_posted", freq="D"),
                             "roles"
-                        ])["count"].sum().reset_index()
-
-                        # Only keep the top 7 roles for clarity
-                        top_roles = roles_df["roles"].value_counts().nlargest(7).index.tolist()
-                        roles_viz_df = roles_viz_df[roles_viz_df["roles"].isin(top_roles)]
+                        ], observed=True).size().reset_index(name="count")
 
                         # Create bar chart
                         fig1 = px.bar(
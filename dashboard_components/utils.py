@@ -4,12 +4,16 @@ Utility functions for dashboard components
 import os
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import logging
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import numpy as np
 import pandas as pd
-import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Configure logging
 logger = logging.getLogger('job_tracker.dashboard.utils')
@@ -22,29 +26,29 @@ try:
 except ImportError:
     print("dotenv package not found, skipping .env loading")
 
-def inject_google_analytics():
-    """Inject Google Analytics tracking code using a dedicated HTML file"""
-    try:
-        # Get the absolute path to the analytics.html file
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        analytics_path = os.path.join(current_dir, "static", "analytics.html")
-
-        # Check if the file exists before trying to read it
-        if not os.path.exists(analytics_path):
-            logger.error(f"Analytics HTML file not found at: {analytics_path}")
-            return
+# orjson decodes the 1000-job payloads several times faster than the stdlib
+# json module that response.json() uses; fall back to it when not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-        # Read the HTML file content
-        with open(analytics_path, 'r') as f:
-            html_content = f.read()
+# Project-level static/ directory (CSS, JS and HTML snippets)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
 
-        # Use streamlit component to insert the HTML
-        st.components.v1.html(html_content, height=1, width=1, scrolling=False)
-        logger.info("Google Analytics tracking code injected successfully")
+@st.cache_data(show_spinner=False)
+def read_static_file(*path_parts):
+    """Return the text of a file under static/, or None if it doesn't exist
 
-    except Exception as e:
-        logger.error(f"Error injecting Google Analytics: {str(e)}")
-        logger.error(traceback.format_exc())
+    Cached for the life of the server so reruns don't re-read the same
+    stylesheets and scripts from disk. Restart the dashboard after editing them.
+    """
+    try:
+        with open(os.path.join(STATIC_DIR, *path_parts)) as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.error(f"Static file not found: {os.path.join(*path_parts)}")
+        return None
 
 # Read API URL from environment or use default
 def get_api_url():
@@ -61,9 +65,20 @@ def get_api_url():
 # Constants
 API_URL = get_api_url()
 
-@st.cache_data(ttl=60)  # Cache data for 1 minute only - reduced from 5 minutes
-def fetch_data(endpoint, params=None):
-    """Fetch data from API with optional parameters"""
+# Shared HTTP session so every API call in a rerun reuses pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake each time
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def _get_json(endpoint, params=None):
+    """GET an API endpoint and return the decoded JSON, raising on failure
+
+    params may be a dict or a sequence of (key, value) pairs; requests does the
+    URL encoding, and repeating a key in the pairs form sends a multi-select
+    filter. Parameters whose value is None are left out.
+    """
     # Ensure endpoint doesn't have trailing slash for consistent URLs
     if endpoint.endswith('/'):
         endpoint = endpoint[:-1]
@@ -72,128 +87,177 @@ def fetch_data(endpoint, params=None):
     api_url = get_api_url()
 
     url = f"{api_url}/{endpoint}"
-    if params:
-        query_params = "&".join([f"{k}={v}" for k, v in params.items() if v is not None])
-        if query_params:
-            url = f"{url}?{query_params}"
+    if isinstance(params, dict):
+        params = params.items()
+    params = [(k, v) for k, v in params or () if v is not None]
 
+    logger.info(f"Fetching data from {endpoint} with params: {params}")
+    fetch_start = time.time()
+    response = _SESSION.get(url, params=params, timeout=10)  # Added timeout
+
+    # Log the actual URL for debugging
+    logger.info(f"Actual request URL: {response.url}")
+
+    # Check for redirect and log it (but still proceed)
+    if response.history:
+        logger.info(f"Redirected from {url} to {response.url}")
+
+    response.raise_for_status()
+    data = _json_loads(response.content)
+    logger.info(f"Fetched data in {time.time() - fetch_start:.2f} seconds")
+    return data
+
+@st.cache_data(ttl=60, show_spinner=False)  # Cache data for 1 minute only - reduced from 5 minutes
+def _fetch_data(endpoint, params):
+    return _get_json(endpoint, params)
+
+def fetch_data(endpoint, params=None):
+    """Fetch data from API with optional parameters
+
+    params is a dict or a list of (key, value) tuples for multi-select
+    support. Results are cached per (endpoint, params) for a minute, so
+    toggling back to a filter combination already seen doesn't query the API
+    again; failures are not cached.
+    """
+    # A tuple of pairs gives the cache a stable, order-preserving key
+    if isinstance(params, dict):
+        params = tuple(params.items())
+    elif params is not None:
+        params = tuple(params)
     try:
-        logger.info(f"Fetching data from: {url}")
-        fetch_start = time.time()
-        response = requests.get(url, timeout=10)  # Added timeout
-
-        # Check for redirect and log it (but still proceed)
-        if response.history:
-            logger.info(f"Redirected from {url} to {response.url}")
-
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Fetched data in {time.time() - fetch_start:.2f} seconds")
-        return data
+        return _fetch_data(endpoint, params)
     except Exception as e:
         logger.error(f"Error fetching data from API: {str(e)}")
         logger.error(traceback.format_exc())
         return None
 
-def fetch_data_with_params(endpoint, params_list):
-    """Fetch data from API with params as a list of tuples for multi-select support"""
-    # Ensure endpoint doesn't have trailing slash for consistent URLs
-    if endpoint.endswith('/'):
-        endpoint = endpoint[:-1]
-
-    # Get current API URL (in case it was updated)
-    api_url = get_api_url()
+# Reference data changes far less often than the job listings, so it gets
+# longer TTLs. Failures raise inside the cached functions so they are never
+# cached; the public wrappers turn them into None like fetch_data does.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_companies():
+    return _get_json("jobs/companies")
 
-    url = f"{api_url}/{endpoint}"
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_job_stats():
+    return _get_json("jobs/stats")
 
+def fetch_companies():
+    """Fetch the list of companies (cached for an hour)"""
     try:
-        logger.info(f"Fetching data from {endpoint} with params: {params_list}")
-        fetch_start = time.time()
-
-        # Use requests with params as a list of tuples
-        # This ensures multiple values for the same key are properly encoded
-        response = requests.get(url, params=params_list, timeout=10)  # Added timeout
-
-        # Log the actual URL for debugging
-        logger.info(f"Actual request URL: {response.url}")
-
-        # Check for redirect and log it (but still proceed)
-        if response.history:
-            logger.info(f"Redirected from {url} to {response.url}")
+        return _fetch_companies()
+    except Exception as e:
+        logger.error(f"Error fetching companies from API: {str(e)}")
+        return None
 
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Fetched data in {time.time() - fetch_start:.2f} seconds")
-        return data
+def fetch_job_stats():
+    """Fetch job statistics (cached for five minutes)"""
+    try:
+        return _fetch_job_stats()
     except Exception as e:
-        logger.error(f"Error fetching data from API: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Error fetching job stats from API: {str(e)}")
         return None
 
-def format_job_date(date_str):
-    """Format job date relative to Eastern Time (US/Eastern).
+def fetch_concurrently(*fetchers):
+    """Run several independent fetch functions in parallel, returning results in order"""
+    # Worker threads need the current script run context to use st.cache_data
+    ctx = get_script_run_ctx()
+
+    def _run(fetcher):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fetcher()
+
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        return list(executor.map(_run, fetchers))
+
+# Fields of a /jobs record the dashboard actually reads; anything else the API
+# adds is dropped before it becomes a DataFrame column
+JOB_COLUMNS = [
+    "id", "job_title", "company", "location", "date_posted",
+    "first_seen", "employment_type", "roles", "job_url",
+]
+
+# Low-cardinality text columns stored as categoricals. company stays a plain
+# string because its value_counts feed the treemap, and a categorical would
+# report zero counts for companies filtered out of the current view.
+CATEGORY_COLUMNS = ["location", "employment_type"]
+
+# Timestamp columns parsed once when the frame is built
+DATE_COLUMNS = ["date_posted", "first_seen"]
+
+def jobs_to_dataframe(jobs):
+    """Build the jobs DataFrame from API records, keeping only JOB_COLUMNS"""
+    df_jobs = pd.DataFrame.from_records(
+        [{column: job.get(column) for column in JOB_COLUMNS} for job in jobs],
+        columns=JOB_COLUMNS,
+    )
+    for column in CATEGORY_COLUMNS:
+        df_jobs[column] = df_jobs[column].astype("category")
+    # The API sends ISO dates ("%Y-%m-%d" / "%Y-%m-%d %H:%M:%S"); naming the
+    # format keeps pandas on its fast ISO path instead of guessing per value
+    for column in DATE_COLUMNS:
+        df_jobs[column] = pd.to_datetime(df_jobs[column], format="ISO8601")
+    return df_jobs
+
+def format_job_dates(dates):
+    """Format a Series of job dates relative to Eastern Time (US/Eastern).
 
     - Today's posts: "X hours ago at 3:45 PM" / "X minutes ago at 3:45 PM"
     - Yesterday: "Yesterday at 3:45 PM"
     - Older: "2026-04-11 at 3:45 PM"
-    """
-    try:
-        import pytz
-        eastern = pytz.timezone('US/Eastern')
 
-        date_obj = pd.to_datetime(date_str)
-
-        if date_obj.tzinfo is None:
-            date_obj = date_obj.tz_localize('UTC')
-
-        date_eastern = date_obj.astimezone(eastern)
-        now_eastern = pd.Timestamp.now(tz=eastern)
-
-        time_str = date_eastern.strftime("%I:%M %p").lstrip('0')
-
-        today_eastern = now_eastern.normalize()
-        yesterday_eastern = today_eastern - pd.Timedelta(days=1)
-        normalized_date = date_eastern.normalize()
-
-        days_diff = (today_eastern - normalized_date).days
-
-        if days_diff == 0:
-            delta = now_eastern - date_eastern
-            total_seconds = int(delta.total_seconds())
-
-            if total_seconds < 60:
-                ago_str = "Just now"
-            elif total_seconds < 3600:
-                mins = total_seconds // 60
-                ago_str = f"{mins} min{'s' if mins != 1 else ''} ago"
-            else:
-                hours = total_seconds // 3600
-                ago_str = f"{hours} hour{'s' if hours != 1 else ''} ago"
-
-            return f"{ago_str} at {time_str} ET"
-        elif days_diff == 1:
-            return f"Yesterday at {time_str} ET"
-        else:
-            return date_eastern.strftime("%Y-%m-%d at %I:%M %p").replace(' 0', ' ') + " ET"
-    except Exception as e:
-        logger.error(f"Error formatting date '{date_str}': {str(e)}")
-        return date_str
+    Works on the whole column at once; missing dates come back as "" and
+    values that can't be parsed as their original text.
+    """
+    dates = pd.Series(dates)
+    parsed = pd.to_datetime(dates, errors="coerce", format="ISO8601")
+    if parsed.dt.tz is None:
+        parsed = parsed.dt.tz_localize("UTC")
+    date_eastern = parsed.dt.tz_convert("US/Eastern")
+    now_eastern = pd.Timestamp.now(tz="US/Eastern")
+
+    days_diff = (now_eastern.normalize() - date_eastern.dt.normalize()).dt.days
+    total_seconds = (now_eastern - date_eastern).dt.total_seconds()
+    time_str = date_eastern.dt.strftime("%I:%M %p").str.lstrip("0")
+
+    # Today: "Just now" / "N min(s) ago" / "N hour(s) ago"
+    mins = (total_seconds // 60).fillna(0).astype(int)
+    hours = (total_seconds // 3600).fillna(0).astype(int)
+    ago_str = pd.Series(
+        np.select(
+            [total_seconds < 60, total_seconds < 3600],
+            ["Just now", mins.astype(str) + np.where(mins != 1, " mins ago", " min ago")],
+            hours.astype(str) + np.where(hours != 1, " hours ago", " hour ago"),
+        ),
+        index=dates.index,
+    )
+
+    older = date_eastern.dt.strftime("%Y-%m-%d at %I:%M %p").str.replace(" 0", " ", regex=False) + " ET"
+    formatted = older.where(days_diff != 1, "Yesterday at " + time_str + " ET")
+    formatted = formatted.where(days_diff != 0, ago_str + " at " + time_str + " ET")
+    unparsed = dates.map(str).where(dates.notna(), "")
+    return formatted.where(date_eastern.notna(), unparsed)
+
+# (connect, read) timeouts for the status probe
+_HEALTH_TIMEOUT = (1, 2)
 
 def check_api_status():
     """Check if the API is available and return status"""
-    try:
-        # Get current API URL
-        api_url = get_api_url()
+    return _probe_api(get_api_url())
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _probe_api(api_url):
+    # Cached per URL so reruns within 30s don't pay a network round-trip
+    try:
         # First try the health endpoint
         try:
-            response = requests.get(f"{api_url}/health", timeout=2)
+            response = _SESSION.get(f"{api_url}/health", timeout=_HEALTH_TIMEOUT)
             if response.status_code == 200:
                 return True, f"✅ API Connection: Good ({api_url})"
         except Exception:
             # If health endpoint fails, try the root endpoint
             try:
-                response = requests.get(f"{api_url}", timeout=2)
+                response = _SESSION.get(f"{api_url}", timeout=_HEALTH_TIMEOUT)
                 if response.status_code in [200, 307, 404]:  # Accept 404 as the server is running
                     return True, f"✅ API Connection: Available ({api_url})"
             except Exception as e:
@@ -203,6 +267,5 @@ def check_api_status():
         # If we got here, the health endpoint returned non-200
         return False, f"⚠️ API Connection: Issue (Status {response.status_code})"
     except Exception as e:
-        api_url = get_api_url()
         logger.error(f"API Connection Failed: {str(e)}")
         return False, f"❌ API Connection Failed: Could not connect to {api_url}"
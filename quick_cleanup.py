@@ -14,6 +14,9 @@ FILES_TO_REMOVE = [
     'setup.py'
 ]
 
+# Subtrees pruned from the __pycache__ sweep
+from utils.cleanup_utils import SKIP_DIRS
+
 def quick_cleanup():
     """Remove test files and cleanup pycache"""
     print("\n===== QUICK PROJECT CLEANUP =====")
@@ -36,6 +39,8 @@ def quick_cleanup():
                 print(f"Removed: {pycache_path}")
             except Exception as e:
                 print(f"Error removing {pycache_path}: {str(e)}")
+        # Don't descend into removed caches, VCS data or virtualenvs
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
     
     print("\n===== CLEANUP COMPLETE =====")
     print("Test files and __pycache__ directories have been removed.")
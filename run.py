@@ -21,7 +21,8 @@ Commands:
         print(usage)  Start the API server
   dashboard    Start the dashboard
   purge        Delete job records older than 7 days
-  cleanup      Clean up the database (remove duplicates, fix issues)
+  cleanup      Clean up the database (remove duplicates, fix issues);
+               add --force to run even if it ran within the last hour
   reset_db     RESET DATABASE - Delete ALL data and start fresh
   quick_clean  Quickly remove test files without confirmation
   free         Free port 8000 if it's in use
@@ -78,7 +79,7 @@ Commands:
     elif command == "cleanup":
         # Clean up the database
         from cleanup import cleanup_database
-        cleanup_database()
+        cleanup_database(force="--force" in sys.argv[2:])
     
     elif command == "reset_db":
         # Reset database completely
@@ -0,0 +1,37 @@
+"""
+Tests for the dashboard's relative job date formatting
+"""
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dashboard_components.utils import format_job_dates
+
+def test_today_yesterday_and_older():
+    """Test that recent dates are relative and older ones are absolute"""
+    now = pd.Timestamp.now(tz="UTC")
+    # Noon ET on the previous calendar day, whatever the time is now
+    yesterday_noon = pd.Timestamp.now(tz="US/Eastern").normalize() - pd.Timedelta(hours=12)
+    formatted = format_job_dates([
+        now.isoformat(),
+        yesterday_noon.tz_convert("UTC").isoformat(),
+        "2026-01-15T20:05:00Z",
+    ])
+    assert formatted[0].startswith("Just now at ")
+    assert formatted[1] == "Yesterday at 12:00 PM ET"
+    assert formatted[2] == "2026-01-15 at 3:05 PM ET"
+
+def test_dst_boundary():
+    """Test that the Eastern offset follows the daylight saving switch"""
+    formatted = format_job_dates(["2026-03-08T06:30:00Z", "2026-03-08T07:30:00Z"])
+    # 1:30 AM EST (UTC-5), then 3:30 AM EDT (UTC-4) after clocks spring forward
+    assert list(formatted) == ["2026-03-08 at 1:30 AM ET", "2026-03-08 at 3:30 AM ET"]
+
+def test_missing_and_unparseable_dates():
+    """Test that missing dates are blank and unparseable ones pass through"""
+    formatted = format_job_dates([None, pd.NaT, float("nan"), "not a date"])
+    assert list(formatted) == ["", "", "", "not a date"]
@@ -0,0 +1,12 @@
+"""
+Shared settings for the project cleanup scripts
+"""
+
+# Directories that never contain anything the cleanup scripts remove. They
+# are pruned from every os.walk so we don't stat the (often huge) VCS,
+# virtualenv and cache trees on each run. cleanup_storage measures .git and
+# backups on their own when it reports what it freed there.
+SKIP_DIRS = frozenset({
+    ".git", "node_modules", "venv", ".venv", "__pycache__",
+    "backups", ".mypy_cache", ".pytest_cache",
+})